@@ -1,5 +1,8 @@
 import flet as ft
 
+# Teclas do display -> operadores Python, montado uma única vez
+TABELA_OPERADORES = str.maketrans({"X": "*", ",": "."})
+
 
 def main(page: ft.Page):
     page.title = "Calculadora"
@@ -17,7 +20,7 @@ def main(page: ft.Page):
 
         elif tecla == "=":
             try:
-                resultado = eval(expressao.replace("X", "*").replace(",", "."))
+                resultado = eval(expressao.translate(TABELA_OPERADORES))
                 display.value = str(resultado)
                 expressao = str(resultado)
             except: